@@ -0,0 +1,67 @@
+"""On-disk Parquet cache for concatenated trade logs.
+
+The cache key is a SHA-256 over (path, mtime, size) of every input CSV, so
+any new, removed or rewritten log file produces a fresh entry.
+"""
+
+import glob
+import hashlib
+import os
+from typing import Callable, List
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (Parquet engine)
+except ImportError:
+    pyarrow = None
+
+
+DEFAULT_CACHE_DIR = os.path.join(".", "models", "_cache")
+
+# Older entries beyond this many are pruned each time a new one is written.
+MAX_CACHE_ENTRIES = 8
+
+
+def files_fingerprint(files: List[str]) -> str:
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(
+            f"{os.path.abspath(path)}|{os.path.getmtime(path)}|{os.path.getsize(path)}\n".encode()
+        )
+    return digest.hexdigest()
+
+
+def _prune(cache_dir: str) -> None:
+    entries = sorted(glob.glob(os.path.join(cache_dir, "*.parquet")), key=os.path.getmtime)
+    for path in entries[:-MAX_CACHE_ENTRIES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def cached_concat(files: List[str],
+                  load: Callable[[List[str]], pd.DataFrame],
+                  cache_dir: str = DEFAULT_CACHE_DIR) -> pd.DataFrame:
+    """Return load(files), reusing a Parquet copy when the inputs are unchanged."""
+    if pyarrow is None:
+        return load(files)
+
+    cache_path = os.path.join(cache_dir, f"{files_fingerprint(files)}.parquet")
+    if os.path.exists(cache_path):
+        try:
+            df = pd.read_parquet(cache_path)
+            print(f"Using cached trade logs: {cache_path}")
+            return df
+        except Exception as ex:
+            print(f"[WARN] Ignoring unreadable log cache {cache_path}: {ex}")
+
+    df = load(files)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        df.to_parquet(cache_path, compression="zstd", index=False)
+        _prune(cache_dir)
+    except Exception as ex:
+        print(f"[WARN] Could not write log cache {cache_path}: {ex}")
+    return df
@@ -0,0 +1,56 @@
+"""Optional Numba kernels for the analysis scripts.
+
+Each kernel has a NumPy fallback with the same signature, used when numba is
+not installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def max_drawdown(eq):
+        # Single pass, no temporaries. Seeded from eq[0] rather than -inf, since
+        # fastmath allows the compiler to assume no infinities.
+        if eq.shape[0] == 0:
+            return 0.0
+        peak = eq[0]
+        mdd = 0.0
+        for i in range(eq.shape[0]):
+            v = eq[i]
+            if v > peak:
+                peak = v
+            d = peak - v
+            if d > mdd:
+                mdd = d
+        return mdd
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def cum_drawdown(profits):
+        # max_drawdown(cumsum(profits)) fused into one loop, so the equity curve
+        # is never materialized.
+        if profits.shape[0] == 0:
+            return 0.0
+        acc = 0.0
+        peak = profits[0]
+        mdd = 0.0
+        for i in range(profits.shape[0]):
+            acc += profits[i]
+            if acc > peak:
+                peak = acc
+            d = peak - acc
+            if d > mdd:
+                mdd = d
+        return mdd
+else:
+    def max_drawdown(eq):
+        peaks = np.maximum.accumulate(eq)
+        return float((peaks - eq).max(initial=0.0))
+
+    def cum_drawdown(profits):
+        return max_drawdown(np.cumsum(profits, dtype=np.float64))
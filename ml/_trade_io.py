@@ -0,0 +1,128 @@
+"""Trade-log loading and CSV output shared by the ml scripts."""
+
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    # pyarrow is optional; loaders fall back to pandas.read_csv without it.
+    pa = None
+
+from _cache import cached_concat
+
+
+def _load_via_arrow(files: List[str]) -> Optional[pd.DataFrame]:
+    """Parse all CSVs with Arrow and convert to pandas once.
+
+    Rows with too many fields are skipped (and counted) instead of failing the
+    file; a row with too few fails the parse. Returns None when pyarrow is
+    unavailable or a file fails to parse or open, so the caller can fall back
+    to the per-file pandas loader.
+    """
+    if pa is None:
+        return None
+
+    read_options = pacsv.ReadOptions(use_threads=True)
+    convert_options = pacsv.ConvertOptions(
+        column_types={
+            "Profit": pa.float64(),
+            # Kept as text: callers parse Time themselves, and a timestamp type
+            # would convert every "+03:00"-style offset to UTC.
+            "Time": pa.string(),
+            "Strategy": pa.string(),
+            "Regime": pa.string(),
+        },
+        strings_can_be_null=True,
+    )
+
+    def read_one(path: str):
+        skipped = []
+
+        def skip_row(row):
+            # Only overlong rows are skipped (pandas rejects the whole file for
+            # them). Short rows are an error here, so the pandas fallback reads
+            # the logs and keeps them NaN-padded, as it always has.
+            if row.actual_columns < row.expected_columns:
+                return "error"
+            skipped.append(row.number)
+            return "skip"
+
+        parse_options = pacsv.ParseOptions(invalid_row_handler=skip_row)
+        table = pacsv.read_csv(path, read_options=read_options,
+                               parse_options=parse_options, convert_options=convert_options)
+        if skipped:
+            print(f"[WARN] Skipped {len(skipped)} malformed rows in {path}")
+        return table
+
+    try:
+        # Arrow releases the GIL while parsing, so file reads overlap across threads.
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as pool:
+            tables = list(pool.map(read_one, files))
+        table = pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowException, OSError) as ex:
+        # OSError covers a log rotated or deleted after the glob; the pandas
+        # loader then warns about and skips that file.
+        print(f"[WARN] Arrow CSV load failed, falling back to pandas: {ex}")
+        return None
+
+    # Release the per-file tables so self_destruct can free buffers while converting.
+    del tables
+    return table.to_pandas(self_destruct=True)
+
+
+def _safe_read(path: str) -> Optional[pd.DataFrame]:
+    try:
+        return pd.read_csv(path)
+    except Exception as ex:
+        print(f"[WARN] Failed to read {path}: {ex}")
+        return None
+
+
+def _read_logs(files: List[str]) -> pd.DataFrame:
+    df = _load_via_arrow(files)
+    if df is not None:
+        return df
+
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as pool:
+        frames = [frame for frame in pool.map(_safe_read, files) if frame is not None]
+
+    if not frames:
+        raise SystemExit("No valid CSV logs could be loaded.")
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def _normalize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    # Label columns become categories so group-bys hash integer codes, not strings.
+    for col in ("Strategy", "Regime", "Symbol", "Signal", "Direction"):
+        if col in df:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def load_trades(log_dir: str, pattern: str = "trades_*.csv") -> pd.DataFrame:
+    """Load and concatenate every trade log in log_dir matching pattern."""
+    full_pattern = os.path.join(log_dir, pattern)
+    files = sorted(glob.glob(full_pattern))
+    if not files:
+        raise SystemExit(f"No trade log files found under {full_pattern}")
+
+    df = cached_concat(files, _read_logs)
+    print(f"Loaded {len(df)} rows from {len(files)} files.")
+    return _normalize_dtypes(df)
+
+
+def write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write df without its index, using Arrow's C++ CSV writer when available."""
+    if pa is None:
+        df.to_csv(path, index=False)
+        return
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(include_header=True))
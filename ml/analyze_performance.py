@@ -1,5 +1,4 @@
 import argparse
-import glob
 import os
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
@@ -7,6 +6,9 @@ from typing import Dict, List, Tuple
 import numpy as np
 import pandas as pd
 
+from _fast import cum_drawdown, max_drawdown
+from _trade_io import load_trades, write_csv
+
 
 @dataclass
 class PerfSummary:
@@ -23,41 +25,28 @@ class PerfSummary:
 
 
 def load_trade_logs(log_dir: str) -> pd.DataFrame:
-    pattern = os.path.join(log_dir, "trades_*.csv")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        raise SystemExit(f"No trade log files found for pattern: {pattern}")
+    return load_trades(log_dir, pattern="trades_*.csv")
 
-    frames: List[pd.DataFrame] = []
-    for path in files:
-        try:
-            df = pd.read_csv(path)
-            frames.append(df)
-        except Exception as ex:
-            print(f"[WARN] Failed to read {path}: {ex}")
 
-    if not frames:
-        raise SystemExit("No valid CSV logs could be loaded.")
+def compute_max_drawdown(equity_curve: np.ndarray) -> float:
+    # Numba single-pass scan when available, NumPy running-peak otherwise.
+    return float(max_drawdown(np.ascontiguousarray(equity_curve, dtype=np.float64)))
 
-    df_all = pd.concat(frames, ignore_index=True)
-    print(f"Loaded {len(df_all)} rows from {len(frames)} files.")
-    return df_all
 
+def _cum_drawdown(profits: np.ndarray) -> float:
+    # Max drawdown of profits.cumsum(), without allocating the equity curve.
+    return float(cum_drawdown(np.ascontiguousarray(profits, dtype=np.float64)))
 
-def compute_max_drawdown(equity_curve: np.ndarray) -> float:
-    peak = -np.inf
-    max_dd = 0.0
-    for v in equity_curve:
-        if v > peak:
-            peak = v
-        dd = peak - v
-        if dd > max_dd:
-            max_dd = dd
-    return float(max_dd)
-
-
-def summarize_strategy(df: pd.DataFrame, strategy: str) -> PerfSummary:
-    if df.empty:
+
+def _summary_from_totals(strategy: str,
+                         total_trades: int,
+                         wins: int,
+                         losses: int,
+                         total_profit: float,
+                         win_sum: float,
+                         loss_sum: float,
+                         max_dd: float) -> PerfSummary:
+    if total_trades == 0:
         return PerfSummary(
             strategy=strategy,
             total_trades=0,
@@ -71,28 +60,15 @@ def summarize_strategy(df: pd.DataFrame, strategy: str) -> PerfSummary:
             max_drawdown=0.0,
         )
 
-    profits = df["Profit"].fillna(0.0).to_numpy(dtype=float)
-    total_trades = len(profits)
-    wins_mask = profits > 0
-    losses_mask = profits < 0
-
-    wins = int(wins_mask.sum())
-    losses = int(losses_mask.sum())
-    win_rate = wins / total_trades * 100.0 if total_trades > 0 else 0.0
-    total_profit = float(profits.sum())
-
-    avg_win = float(profits[wins_mask].mean()) if wins > 0 else 0.0
-    avg_loss = float(profits[losses_mask].mean()) if losses > 0 else 0.0
+    win_rate = wins / total_trades * 100.0
+    avg_win = win_sum / wins if wins > 0 else 0.0
+    avg_loss = loss_sum / losses if losses > 0 else 0.0
 
     # Basic expectancy: p(win)*avg_win + p(loss)*avg_loss
-    p_win = wins / total_trades if total_trades > 0 else 0.0
-    p_loss = losses / total_trades if total_trades > 0 else 0.0
+    p_win = wins / total_trades
+    p_loss = losses / total_trades
     expectancy = p_win * avg_win + p_loss * avg_loss
 
-    # Equity curve (cumulative P/L) and max drawdown in profit units
-    equity = profits.cumsum()
-    max_dd = compute_max_drawdown(equity)
-
     return PerfSummary(
         strategy=strategy,
         total_trades=total_trades,
@@ -107,6 +83,64 @@ def summarize_strategy(df: pd.DataFrame, strategy: str) -> PerfSummary:
     )
 
 
+def summarize_strategy(profits: np.ndarray, strategy: str) -> PerfSummary:
+    wins_mask = profits > 0
+    losses_mask = profits < 0
+
+    # Max drawdown of the cumulative P/L curve, in profit units
+    max_dd = _cum_drawdown(profits)
+
+    return _summary_from_totals(
+        strategy,
+        total_trades=len(profits),
+        wins=int(wins_mask.sum()),
+        losses=int(losses_mask.sum()),
+        total_profit=float(profits.sum()),
+        win_sum=float(profits[wins_mask].sum()),
+        loss_sum=float(profits[losses_mask].sum()),
+        max_dd=max_dd,
+    )
+
+
+def summarize_by_strategy(profits: np.ndarray, strategies: pd.Series) -> List[PerfSummary]:
+    """Per-strategy summaries from one stable sort and segment-wise reductions."""
+    codes, names = pd.factorize(strategies, sort=False)
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]  # rows without a strategy are not grouped
+    if order.size == 0:
+        return []
+
+    p = profits[order]
+    c = codes[order]
+    starts = np.r_[0, np.flatnonzero(np.diff(c)) + 1]
+    ends = np.r_[starts[1:], p.size]
+
+    wins_mask = p > 0
+    losses_mask = p < 0
+    counts = ends - starts
+    totals = np.add.reduceat(p, starts)
+    wins = np.add.reduceat(wins_mask.astype(np.int64), starts)
+    losses = np.add.reduceat(losses_mask.astype(np.int64), starts)
+    win_sums = np.add.reduceat(np.where(wins_mask, p, 0.0), starts)
+    loss_sums = np.add.reduceat(np.where(losses_mask, p, 0.0), starts)
+
+    # The stable sort keeps each strategy's trades in log order, so every
+    # segment is that strategy's own equity curve.
+    return [
+        _summary_from_totals(
+            str(names[c[start]]),
+            total_trades=int(counts[k]),
+            wins=int(wins[k]),
+            losses=int(losses[k]),
+            total_profit=float(totals[k]),
+            win_sum=float(win_sums[k]),
+            loss_sum=float(loss_sums[k]),
+            max_dd=_cum_drawdown(p[start:end]),
+        )
+        for k, (start, end) in enumerate(zip(starts, ends))
+    ]
+
+
 def run_analysis(df: pd.DataFrame) -> Tuple[PerfSummary, List[PerfSummary]]:
     if "Profit" not in df.columns:
         raise SystemExit("Expected 'Profit' column in trade logs.")
@@ -115,11 +149,11 @@ def run_analysis(df: pd.DataFrame) -> Tuple[PerfSummary, List[PerfSummary]]:
         df = df.copy()
         df["Strategy"] = df.get("StrategyName", "Unknown")
 
-    overall = summarize_strategy(df, strategy="ALL")
+    profits = df["Profit"].to_numpy(dtype=np.float64, na_value=0.0)
+    overall = summarize_strategy(profits, strategy="ALL")
 
-    per_strategy: List[PerfSummary] = []
-    for strat, group in df.groupby("Strategy"):
-        per_strategy.append(summarize_strategy(group, strategy=str(strat)))
+    per_strategy = summarize_by_strategy(profits, df["Strategy"])
+    per_strategy.sort(key=lambda s: s.strategy)
 
     return overall, per_strategy
 
@@ -182,7 +216,7 @@ def main():
         os.makedirs(out_dir, exist_ok=True)
 
     out_df = pd.DataFrame(rows)
-    out_df.to_csv(args.output_csv, index=False)
+    write_csv(out_df, args.output_csv)
     print(f"Saved performance summary to: {args.output_csv}")
     print(out_df.to_string(index=False))
 
@@ -1,8 +1,11 @@
 import argparse
 import os
 
+import numpy as np
 import pandas as pd
 
+from _trade_io import write_csv
+
 
 def load_summary(path: str) -> pd.DataFrame:
     if not os.path.exists(path):
@@ -10,6 +13,7 @@ def load_summary(path: str) -> pd.DataFrame:
     df = pd.read_csv(path)
     if "Strategy" not in df.columns:
         raise SystemExit(f"Expected a 'Strategy' column in {path}")
+    df["Strategy"] = df["Strategy"].astype("string")
     return df
 
 
@@ -17,7 +21,14 @@ def compare_runs(
     base: pd.DataFrame,
     candidate: pd.DataFrame,
 ) -> pd.DataFrame:
-    # Merge on Strategy name
+    # Merge on Strategy name, as a categorical shared by both sides so the join
+    # hashes integer codes rather than strings. Missing names (blank cells, or
+    # "NA"/"None"/"null" as read by pandas) cannot be categories, and would sort
+    # first rather than last, so those inputs merge on the plain strings.
+    if not (base["Strategy"].isna().any() or candidate["Strategy"].isna().any()):
+        cats = pd.Index(base["Strategy"]).union(candidate["Strategy"])
+        base = base.assign(Strategy=pd.Categorical(base["Strategy"], categories=cats))
+        candidate = candidate.assign(Strategy=pd.Categorical(candidate["Strategy"], categories=cats))
     merged = base.merge(
         candidate,
         on="Strategy",
@@ -45,11 +56,17 @@ def compare_runs(
         if col_c not in merged.columns:
             merged[col_c] = 0.0
 
-    # Compute deltas (candidate - base)
-    for col in num_cols:
-        merged[f"{col}_delta"] = merged[f"{col}_candidate"] - merged[f"{col}_base"]
+    # Compute deltas (candidate - base) as one block subtraction. NaN (strategy
+    # missing on one side) propagates into the delta, as with column arithmetic.
+    base_vals = merged[[f"{col}_base" for col in num_cols]].to_numpy(dtype=np.float64, na_value=np.nan)
+    cand_vals = merged[[f"{col}_candidate" for col in num_cols]].to_numpy(dtype=np.float64, na_value=np.nan)
+    deltas = pd.DataFrame(
+        cand_vals - base_vals,
+        columns=[f"{col}_delta" for col in num_cols],
+        index=merged.index,
+    )
 
-    return merged
+    return pd.concat([merged, deltas], axis=1)
 
 
 def main():
@@ -87,7 +104,7 @@ def main():
 
     out_dir = os.path.dirname(args.output) or "."
     os.makedirs(out_dir, exist_ok=True)
-    diff.to_csv(args.output, index=False)
+    write_csv(diff, args.output)
 
     print(f"Saved comparison to: {args.output}")
     # Print a compact view
@@ -1,15 +1,16 @@
 import argparse
-import glob
 import json
 import os
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report, roc_auc_score, brier_score_loss
 
+from _trade_io import load_trades
+
 
 META_COLUMNS = {
     "Time",
@@ -36,25 +37,7 @@ META_COLUMNS = {
 
 
 def load_trade_logs(log_dir: str) -> pd.DataFrame:
-    pattern = os.path.join(log_dir, "trades_*.csv")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        raise SystemExit(f"No trade log files found under {pattern}")
-
-    frames = []
-    for path in files:
-        try:
-            df = pd.read_csv(path)
-            frames.append(df)
-        except Exception as ex:
-            print(f"[WARN] Failed to read {path}: {ex}")
-
-    if not frames:
-        raise SystemExit("No valid CSV logs could be loaded.")
-
-    df_all = pd.concat(frames, ignore_index=True)
-    print(f"Loaded {len(df_all)} rows from {len(frames)} files.")
-    return df_all
+    return load_trades(log_dir, pattern="trades_*.csv")
 
 
 def infer_feature_columns(df: pd.DataFrame) -> List[str]:
@@ -72,34 +55,50 @@ def infer_feature_columns(df: pd.DataFrame) -> List[str]:
     return feature_cols
 
 
-def prepare_edge_dataset(df: pd.DataFrame, feature_cols: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+def project_edge_features(df: pd.DataFrame,
+                          feature_cols: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Dense features, win labels and a row-validity mask, all aligned with df's rows."""
     if "Profit" not in df.columns:
         raise SystemExit("Profit column is required for edge training.")
 
-    data = df.dropna(subset=["Profit"] + feature_cols)
-    if data.empty:
+    # C-contiguous float64: lbfgs converges poorly in float32 on these unscaled features.
+    F = np.ascontiguousarray(df[feature_cols].to_numpy(dtype=np.float64, na_value=np.nan))
+    profit = df["Profit"].to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~(np.isnan(F).any(axis=1) | np.isnan(profit))
+    if not valid.any():
         raise SystemExit("No usable rows for edge training after filtering Profit.")
 
-    X = data[feature_cols].values.astype(float)
-    y = (data["Profit"] > 0.0).astype(int).values
-    return X, y
+    y_all = (profit > 0.0).astype(np.int32)
+    return F, y_all, valid
 
 
-def train_edge_model(X: np.ndarray, y: np.ndarray):
+def prepare_edge_dataset(df: pd.DataFrame, feature_cols: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    F, y_all, valid = project_edge_features(df, feature_cols)
+    return F[valid], y_all[valid]
+
+
+def train_edge_model(X: np.ndarray, y: np.ndarray, init: Optional[LogisticRegression] = None):
     model = LogisticRegression(
         max_iter=500,
         n_jobs=None,
+        warm_start=init is not None,
     )
+    if init is not None:
+        # Per-strategy fits share the global feature space, so start from its solution.
+        model.coef_ = init.coef_.copy()
+        model.intercept_ = init.intercept_.copy()
     model.fit(X, y)
     return model
 
 
 def evaluate_edge_model(model: LogisticRegression, X: np.ndarray, y: np.ndarray) -> str:
-    y_pred = model.predict(X)
-    y_prob = model.predict_proba(X)[:, 1]
+    # One pass over X: predict() is decision_function > 0, and AUC only needs
+    # monotone scores, so the sigmoid from predict_proba is not needed.
+    scores = model.decision_function(X)
+    y_pred = model.classes_[(scores > 0).astype(np.int32)]
     report = classification_report(y, y_pred)
     try:
-        auc = roc_auc_score(y, y_prob)
+        auc = roc_auc_score(y, scores)
         report += f"\nAUC: {auc:.4f}\n"
     except Exception:
         pass
@@ -156,7 +155,8 @@ def main():
 
     df = load_trade_logs(args.log_dir)
     feature_cols = infer_feature_columns(df)
-    X, y = prepare_edge_dataset(df, feature_cols)
+    F, y_all, valid = project_edge_features(df, feature_cols)
+    X, y = F[valid], y_all[valid]
 
     print("Training logistic regression for trade outcome (edge)...")
     model = train_edge_model(X, y)
@@ -178,13 +178,20 @@ def main():
     # Train per-strategy models where we have enough data
     strategy_models: Dict[str, LogisticRegression] = {}
     n_samples_per_strategy: Dict[str, int] = {}
-    for strategy, group in df.groupby("Strategy"):
-        if len(group) < 50:
+
+    # Per-strategy sets are gathered from the one projection by row position,
+    # visiting strategies in name order so the exported "strategies" list is sorted.
+    groups = df.groupby("Strategy", sort=False, observed=True).indices
+    for strategy in sorted(groups):
+        idx = groups[strategy]
+        if len(idx) < 50:
+            continue
+        rows = idx[valid[idx]]
+        if rows.size == 0:
             continue
-        X_s, y_s = prepare_edge_dataset(group, feature_cols)
-        lm = train_edge_model(X_s, y_s)
+        lm = train_edge_model(F[rows], y_all[rows], init=model)
         strategy_models[strategy] = lm
-        n_samples_per_strategy[strategy] = len(group)
+        n_samples_per_strategy[strategy] = len(idx)
 
     export_per_strategy_models(
         global_model=model,
@@ -1,5 +1,4 @@
 import argparse
-import glob
 import json
 import os
 from datetime import datetime
@@ -9,27 +8,11 @@ import pandas as pd
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report
 
+from _trade_io import load_trades
 
-def load_trade_logs(log_dir: str) -> pd.DataFrame:
-    pattern = os.path.join(log_dir, "trades_*.csv")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        raise SystemExit(f"No trade log files found under {pattern}")
-
-    frames = []
-    for path in files:
-        try:
-            df = pd.read_csv(path)
-            frames.append(df)
-        except Exception as ex:
-            print(f"[WARN] Failed to read {path}: {ex}")
-
-    if not frames:
-        raise SystemExit("No valid CSV logs could be loaded.")
 
-    df_all = pd.concat(frames, ignore_index=True)
-    print(f"Loaded {len(df_all)} rows from {len(frames)} files.")
-    return df_all
+def load_trade_logs(log_dir: str) -> pd.DataFrame:
+    return load_trades(log_dir, pattern="trades_*.csv")
 
 
 def prepare_regime_dataset(df: pd.DataFrame):
@@ -38,16 +21,16 @@ def prepare_regime_dataset(df: pd.DataFrame):
     if missing:
         raise SystemExit(f"Missing required columns for regime training: {missing}")
 
-    data = df[required_cols].dropna()
-
-    # Filter out rows with Unknown / NaN regimes
-    data = data[data["Regime"].notna()]
-    data = data[data["Regime"] != "Unknown"]
+    # One mask for missing values and Unknown regimes, then a single gather.
+    mask = df[required_cols].notna().to_numpy().all(axis=1)
+    mask &= (df["Regime"] != "Unknown").to_numpy()
+    data = df.loc[mask, required_cols]
 
     if data.empty:
         raise SystemExit("No usable rows for regime training after filtering.")
 
-    X = data[["Price", "Volatility", "TrendSlope"]].values.astype(float)
+    # C-contiguous, so the solver does not make its own copy.
+    X = np.ascontiguousarray(data[["Price", "Volatility", "TrendSlope"]].to_numpy(dtype=np.float64))
     y = data["Regime"].astype(str).values
 
     return X, y
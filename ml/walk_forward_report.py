@@ -1,61 +1,59 @@
 import argparse
-import glob
 import os
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
+from _trade_io import load_trades, write_csv
+
 
 def load_logs(log_dir: str) -> pd.DataFrame:
-    pattern = os.path.join(log_dir, "trades-*.csv")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        raise SystemExit(f"No trade logs found under {pattern}")
-
-    frames = []
-    for path in files:
-        try:
-            frames.append(pd.read_csv(path))
-        except Exception as ex:
-            print(f"[WARN] Failed to read {path}: {ex}")
-
-    if not frames:
-        raise SystemExit("No usable CSV logs found.")
-
-    df = pd.concat(frames, ignore_index=True)
+    df = load_trades(log_dir, pattern="trades-*.csv")
     df["Time"] = pd.to_datetime(df["Time"], errors="coerce")
     df = df.dropna(subset=["Time"])
     return df
 
 
-def summarize(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df["Date"] = df["Time"].dt.date
-    df["Win"] = df["Profit"] > 0
+NS_PER_DAY = 86_400_000_000_000
 
-    daily = df.groupby("Date").agg(
-        trades=("Profit", "count"),
-        wins=("Win", "sum"),
-        net_pl=("Profit", "sum"),
-        avg_pl=("Profit", "mean"),
-    )
-    daily["win_rate"] = (daily["wins"] / daily["trades"]) * 100.0
 
-    regime = df.groupby("Regime").agg(
+def _aggregate(small: pd.DataFrame, key: str) -> pd.DataFrame:
+    # Only the (small) aggregated result is sorted, not the grouping pass.
+    out = small.groupby(key, sort=False, observed=True).agg(
         trades=("Profit", "count"),
         wins=("Win", "sum"),
         net_pl=("Profit", "sum"),
         avg_pl=("Profit", "mean"),
-    )
-    regime["win_rate"] = (regime["wins"] / regime["trades"]) * 100.0
+    ).sort_index()
+    out["win_rate"] = (out["wins"] / out["trades"]) * 100.0
+    return out
 
-    strategy = df.groupby("Strategy").agg(
-        trades=("Profit", "count"),
-        wins=("Win", "sum"),
-        net_pl=("Profit", "sum"),
-        avg_pl=("Profit", "mean"),
+
+def summarize(df: pd.DataFrame) -> pd.DataFrame:
+    # Integer day number rather than boxed datetime.date objects, so the daily
+    # group-by hashes ints. Days follow the log's own wall-clock time (as dt.date
+    # does), so offset timestamps are made naive before taking the i8 view.
+    time = df["Time"]
+    if time.dt.tz is not None:
+        time = time.dt.tz_localize(None)
+    t = time.to_numpy("datetime64[ns]").view("i8")
+
+    # Narrow projection of just the grouping keys and values, instead of copying the whole frame.
+    small = pd.DataFrame({
+        "DayBucket": (t // NS_PER_DAY).astype(np.int32),
+        "Regime": df["Regime"],
+        "Strategy": df["Strategy"],
+        "Profit": df["Profit"],
+        "Win": (df["Profit"].to_numpy() > 0).view(np.int8),  # bool -> int8 is a view, no copy
+    })
+
+    daily = _aggregate(small, "DayBucket")
+    daily.index = pd.Index(
+        pd.to_datetime(daily.index.to_numpy(np.int64) * NS_PER_DAY).date, name="Date"
     )
-    strategy["win_rate"] = (strategy["wins"] / strategy["trades"]) * 100.0
+    regime = _aggregate(small, "Regime")
+    strategy = _aggregate(small, "Strategy")
 
     return daily, regime, strategy
 
@@ -76,9 +74,9 @@ def main():
     regime_path = os.path.join(args.out_dir, f"walk_forward_regime_{ts}.csv")
     strat_path = os.path.join(args.out_dir, f"walk_forward_strategy_{ts}.csv")
 
-    daily.to_csv(daily_path)
-    regime.to_csv(regime_path)
-    strategy.to_csv(strat_path)
+    write_csv(daily.reset_index(), daily_path)
+    write_csv(regime.reset_index(), regime_path)
+    write_csv(strategy.reset_index(), strat_path)
 
     print(f"Wrote daily report: {daily_path}")
     print(f"Wrote regime report: {regime_path}")